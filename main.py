@@ -7,6 +7,7 @@ Usage Examples:
     python main.py                          # Convert files in ./data
     python main.py -i ./photos -o ./output  # Custom directories
     python main.py --overwrite              # Overwrite existing files
+    python main.py -j 4 --chunksize 8       # Tune parallel workers
     python main.py -v                       # Enable verbose logging
 
 Programmatic Usage:
@@ -17,9 +18,15 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+import queue
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, Iterator, List, Tuple
 import shutil
 
 logging.basicConfig(
@@ -29,20 +36,72 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 SUBPROCESS_TIMEOUT = 60
+SIPS_BATCH_SIZE = 32
+HEIC_SUFFIXES = (".heic", ".HEIC")
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# zlib level for Pillow's PNG encoder; 1 is several times faster than the
+# default of 6 for output that is only slightly larger
+DEFAULT_PNG_COMPRESS_LEVEL = 1
+# Files handed to a Pillow worker process per round trip
+DEFAULT_CHUNKSIZE = 4
+# "spng" encodes through libspng (pyspng-seunglab), whose SIMD-accelerated
+# filtering and DEFLATE outpace Pillow; "auto" uses it when installed
+ENCODERS = ("auto", "pillow", "spng")
+_SPNG_CHANNELS = {"L": 1, "RGB": 3, "RGBA": 4}
+# Number of files ahead of the decoder whose reads are queued with the kernel
+READAHEAD_DEPTH = 32
+
+# Scratch image reused across conversions in this process. Photos from one
+# device share dimensions, so the large pixel buffer is allocated only once.
+_IMAGE_POOL: dict = {}
+# Modes Pillow can map onto the decoder's buffer without copying it
+_SHARED_BUFFER_MODES = ("L", "RGBA", "RGBX")
+
+# Resolved once per process so neither the capability check (repeated in
+# every pool worker) nor each launch repeats the $PATH search
+_SIPS_PATH = shutil.which("sips")
+_HAS_SIPS = _SIPS_PATH is not None
+
+
+def _run_sips(args: List[str], timeout: int) -> subprocess.CompletedProcess:
+    # With an absolute executable and close_fds=False, CPython launches the
+    # child through posix_spawn() rather than fork/exec followed by a loop
+    # closing every possible descriptor. Python's own descriptors are
+    # non-inheritable by default, so nothing extra leaks into sips.
+    return subprocess.run(
+        [_SIPS_PATH or "sips", *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        close_fds=False,
+        timeout=timeout,
+    )
 
 
-def _has_sips() -> bool:
-    return shutil.which("sips") is not None
+def _copy_if_png(src: Path, dst: Path) -> Tuple[bool, str] | None:
+    """
+    Copy src to dst when it is already a PNG behind a .heic name, as some
+    screenshots and exports are. Returns None when src needs converting.
+    """
+    try:
+        with open(src, "rb") as f:
+            if f.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+                return None
+    except OSError:
+        # Leave it to the converter, which reports the error
+        return None
+
+    try:
+        shutil.copyfile(src, dst)
+        return True, ""
+    except Exception as e:
+        return False, str(e)
 
 
 def _convert_with_sips(src: Path, dst: Path) -> Tuple[bool, str]:
     try:
-        result = subprocess.run(
-            ["sips", "-s", "format", "png", str(src), "--out", str(dst)],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=SUBPROCESS_TIMEOUT,
+        result = _run_sips(
+            ["-s", "format", "png", str(src), "--out", str(dst)], SUBPROCESS_TIMEOUT
         )
         if result.returncode == 0:
             return True, ""
@@ -53,56 +112,392 @@ def _convert_with_sips(src: Path, dst: Path) -> Tuple[bool, str]:
         return False, str(e)
 
 
-def _convert_with_pillow(src: Path, dst: Path) -> Tuple[bool, str]:
+def _convert_batch_with_sips(pairs: List[Tuple[Path, Path]]) -> List[Tuple[bool, str]]:
+    """Convert a batch of files, copying PNG wrappers and running sips on the rest."""
+    copied = [_copy_if_png(src, dst) for src, dst in pairs]
+    remaining = [pair for pair, result in zip(pairs, copied) if result is None]
+    converted = iter(_run_sips_batch(remaining))
+    return [next(converted) if result is None else result for result in copied]
+
+
+def _details_for(src: Path, details: str) -> str:
+    """Pick the lines of a batch's sips output that mention src."""
+    lines = [line for line in details.splitlines() if src.name in line]
+    return "\n".join(lines) or details or "sips produced no output"
+
+
+def _run_sips_batch(pairs: List[Tuple[Path, Path]]) -> List[Tuple[bool, str]]:
+    """
+    Convert several files with a single sips invocation.
+
+    sips writes into a scratch directory inside the output directory, so a
+    batch can never clobber its sources when input and output directories
+    are the same. Each result is then moved onto its final name.
+    """
+    if not pairs:
+        return []
+    if len(pairs) == 1:
+        return [_convert_with_sips(*pairs[0])]
+
+    timeout = SUBPROCESS_TIMEOUT * len(pairs)
     try:
-        from PIL import Image  # type: ignore
-        try:
-            import pillow_heif  # type: ignore
+        scratch = tempfile.TemporaryDirectory(dir=pairs[0][1].parent)
+    except OSError as e:
+        return [(False, str(e))] * len(pairs)
 
-            pillow_heif.register_heif_opener()
-        except Exception:
+    with scratch as tmp:
+        try:
+            result = _run_sips(
+                ["-s", "format", "png", *(str(src) for src, _ in pairs), "--out", tmp], timeout
+            )
+            details = result.stderr.strip() or result.stdout.strip()
+        except subprocess.TimeoutExpired:
+            details = f"Conversion timed out after {timeout} seconds"
+        except Exception as e:
+            details = str(e)
+
+        results = []
+        for src, dst in pairs:
+            produced = Path(tmp) / (src.stem + ".png")
+            if not produced.exists():
+                # Older sips releases keep the source file name when given --out <dir>
+                produced = Path(tmp) / src.name
+            if not produced.exists():
+                results.append((False, _details_for(src, details)))
+                continue
             try:
-                import pyheif  # type: ignore
-
-                def _open_heif(path: Path):
-                    heif_file = pyheif.read(path.read_bytes())
-                    image = Image.frombytes(
-                        heif_file.mode,
-                        heif_file.size,
-                        heif_file.data,
-                        "raw",
-                        heif_file.mode,
-                        heif_file.stride,
-                    )
-                    return image
-
-                img = _open_heif(src)
-                img.save(dst, format="PNG")
-                return True, ""
-            except Exception as e2:
-                return False, (
-                    "Pillow HEIC support not available. Install 'pillow-heif' or 'pyheif'. "
-                    f"Details: {e2}"
-                )
-
-        with Image.open(src) as im:
-            im.save(dst, format="PNG")
+                os.replace(produced, dst)
+            except OSError as e:
+                results.append((False, str(e)))
+            else:
+                results.append((True, ""))
+        return results
+
+
+def _pooled_image(mode: str, size: Tuple[int, int], data, stride: int):
+    from PIL import Image  # type: ignore
+
+    key = (mode, size)
+    image = _IMAGE_POOL.get(key)
+    if image is None:
+        _IMAGE_POOL.clear()
+        image = _IMAGE_POOL[key] = Image.new(mode, size)
+    image.frombytes(data, "raw", mode, stride)
+    return image
+
+
+def _heif_to_image(heif_file):
+    """
+    Wrap decoded pixels in a PIL image with as few copies as possible.
+
+    Modes Pillow can map share the decoder's buffer, so heif_file must stay
+    alive until the image has been saved. Other modes are copied into the
+    pooled scratch image.
+    """
+    from PIL import Image  # type: ignore
+
+    mode = heif_file.mode
+    if mode in _SHARED_BUFFER_MODES:
+        return Image.frombuffer(
+            mode, heif_file.size, heif_file.data, "raw", mode, heif_file.stride, 1
+        )
+    return _pooled_image(mode, heif_file.size, heif_file.data, heif_file.stride)
+
+
+def _decode_heif(src: Path):
+    """
+    Decode the primary image of a HEIC file.
+
+    Returns an object exposing mode, size, data and stride, from pillow-heif
+    when it is installed and from pyheif otherwise.
+    """
+    try:
+        import pillow_heif  # type: ignore
+    except Exception:
+        try:
+            import pyheif  # type: ignore
+        except Exception as e:
+            raise RuntimeError(
+                "Pillow HEIC support not available. Install 'pillow-heif' or 'pyheif'. "
+                f"Details: {e}"
+            ) from e
+        # pyheif reads the file itself and hands libheif that buffer without
+        # copying; an mmap would only be read() into a fresh bytes object
+        return pyheif.read(src)
+
+    heif_file = pillow_heif.open_heif(src, convert_hdr_to_8bit=True)
+    heif_file.data  # open_heif is lazy; force the decode to happen here
+    return heif_file
+
+
+def _has_spng() -> bool:
+    try:
+        import pyspng  # type: ignore
+    except Exception:
+        return False
+    # The upstream pyspng distribution only decodes
+    return hasattr(pyspng, "encode")
+
+
+def _encode_png_spng(heif_file, dst: Path, png_compress_level: int) -> None:
+    import numpy as np  # type: ignore
+    import pyspng  # type: ignore
+
+    width, height = heif_file.size
+    channels = _SPNG_CHANNELS[heif_file.mode]
+    rows = np.frombuffer(heif_file.data, dtype=np.uint8).reshape(height, heif_file.stride)
+    pixels = rows[:, : width * channels].reshape(height, width, channels)
+    with open(dst, "wb") as f:
+        f.write(pyspng.encode(pixels, compress_level=png_compress_level))
+
+
+def _icc_profile(heif_file) -> bytes | None:
+    """Return the ICC profile of a pillow-heif or pyheif decode, if any."""
+    info = getattr(heif_file, "info", None)
+    if info is not None:
+        return info.get("icc_profile") or None
+    # pyheif also reports nclx colour descriptions here, which are not ICC data
+    profile = getattr(heif_file, "color_profile", None) or {}
+    if profile.get("type") in ("prof", "rICC"):
+        return profile.get("data") or None
+    return None
+
+
+def _encode_png(heif_file, dst: Path, png_compress_level: int, encoder: str) -> None:
+    icc_profile = _icc_profile(heif_file)
+    # pyspng cannot write an iCCP chunk, so profiled images stay on Pillow
+    if encoder == "spng" and heif_file.mode in _SPNG_CHANNELS and not icc_profile:
+        _encode_png_spng(heif_file, dst, png_compress_level)
+        return
+
+    # Wrap the decoded pixels directly instead of going through the
+    # registered opener, which builds its own intermediate image first
+    im = _heif_to_image(heif_file)
+    im.save(
+        dst,
+        format="PNG",
+        compress_level=png_compress_level,
+        optimize=False,
+        icc_profile=icc_profile,
+    )
+
+
+def _convert_with_pillow(
+    src: Path,
+    dst: Path,
+    png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+    encoder: str = "pillow",
+) -> Tuple[bool, str]:
+    copied = _copy_if_png(src, dst)
+    if copied is not None:
+        return copied
+    try:
+        _encode_png(_decode_heif(src), dst, png_compress_level, encoder)
         return True, ""
     except Exception as e:
         return False, str(e)
 
 
+def _readahead(path: Path) -> None:
+    """Ask the kernel to start reading path into the page cache in the background."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _convert_pipelined(
+    pairs: List[Tuple[Path, Path]], png_compress_level: int, encoder: str
+) -> Iterator[Tuple[bool, str]]:
+    """
+    Convert files with Pillow, decoding the next HEIC on a background thread
+    while the current image is encoded to PNG.
+
+    Both libheif and zlib release the GIL, so the two stages overlap even
+    without a process pool. Reads for the next READAHEAD_DEPTH files are
+    handed to the kernel up front, so storage latency hides behind decoding.
+    Results are yielded in input order.
+    """
+    frames: queue.Queue = queue.Queue(maxsize=2)
+
+    def produce() -> None:
+        for src, _ in pairs[:READAHEAD_DEPTH]:
+            _readahead(src)
+        for i, (src, dst) in enumerate(pairs):
+            if i + READAHEAD_DEPTH < len(pairs):
+                _readahead(pairs[i + READAHEAD_DEPTH][0])
+            copied = _copy_if_png(src, dst)
+            if copied is not None:
+                frames.put((dst, None, copied))
+                continue
+            try:
+                frames.put((dst, _decode_heif(src), None))
+            except Exception as e:
+                frames.put((dst, None, (False, str(e))))
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    for _ in pairs:
+        dst, heif_file, result = frames.get()
+        if result is not None:
+            yield result
+            continue
+        try:
+            _encode_png(heif_file, dst, png_compress_level, encoder)
+            yield True, ""
+        except Exception as e:
+            yield False, str(e)
+
+
+def _chunked(items: Iterable[Tuple[Path, Path]], size: int) -> Iterator[List[Tuple[Path, Path]]]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _set_decode_threads(count: int) -> None:
+    """
+    Set how many threads libheif may use to decode a single image.
+
+    Pool workers already decode one image per core, so each is held to one
+    thread to avoid oversubscribing the CPU. A lone decoder may use every core.
+    """
+    try:
+        import pillow_heif  # type: ignore
+    except Exception:
+        return
+    pillow_heif.options.DECODE_THREADS = count
+
+
+def _iter_results(
+    pending: List[Tuple[Path, Path]],
+    use_sips: bool,
+    png_compress_level: int,
+    encoder: str,
+    jobs: int | None,
+    chunksize: int,
+) -> Iterator[Tuple[Path, bool, str]]:
+    """Convert pending (src, dst) pairs, yielding (src, ok, msg) in input order."""
+    if not pending:
+        return
+
+    cpus = os.cpu_count() or 1
+    if use_sips:
+        # sips runs out of process, so threads only wait on it; oversubscribe
+        # to keep the disk busy and skip the cost of Python worker processes
+        workers = jobs or min(32, 2 * cpus)
+        # Shrink batches on small runs so every worker still gets a sips process
+        batch_size = max(1, min(SIPS_BATCH_SIZE, -(-len(pending) // workers)))
+        chunks = list(_chunked(pending, batch_size))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for chunk, results in zip(chunks, executor.map(_convert_batch_with_sips, chunks)):
+                for (src, _), (ok, msg) in zip(chunk, results):
+                    yield src, ok, msg
+        return
+
+    jobs = jobs or cpus
+    if jobs == 1:
+        # No process pool to spread over; overlap decode and encode instead
+        _set_decode_threads(cpus)
+        results = _convert_pipelined(pending, png_compress_level, encoder)
+        for (src, _), (ok, msg) in zip(pending, results):
+            yield src, ok, msg
+        return
+
+    # Decoding is CPU-bound, so Pillow work goes to worker processes. Never
+    # start more of them than there are chunks to hand out.
+    srcs = [src for src, _ in pending]
+    dsts = [dst for _, dst in pending]
+    workers = min(jobs, -(-len(pending) // chunksize))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_set_decode_threads, initargs=(1,)
+    ) as executor:
+        results = executor.map(
+            _convert_with_pillow,
+            srcs,
+            dsts,
+            repeat(png_compress_level),
+            repeat(encoder),
+            chunksize=chunksize,
+        )
+        for src, (ok, msg) in zip(srcs, results):
+            yield src, ok, msg
+
+
+def _log_outcome(src: Path, ok: bool, msg: str) -> Tuple[str, bool, str]:
+    if ok:
+        logger.info(f"Successfully converted {src.name}")
+    else:
+        logger.error(f"Failed to convert {src.name}: {msg}")
+    return src.name, ok, msg
+
+
 def iter_heic_files(directory: Path) -> Iterable[Path]:
-    suffixes = {".heic", ".HEIC"}
-    for p in directory.iterdir():
-        if p.is_file() and p.suffix in suffixes:
-            yield p
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(HEIC_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                yield Path(entry.path)
+
+
+def pending_conversions(
+    in_dir: Path, out_dir: Path, overwrite: bool = False
+) -> Iterator[Tuple[Path, Path]]:
+    """
+    Yield (src, dst) pairs for the HEIC files in in_dir that need converting.
+
+    Scanning, the overwrite check and destination naming happen in a single
+    pass: each directory is listed once, non-files are filtered by their
+    cached dirent type and existing outputs are looked up in a set. Names are
+    compared case-insensitively, as on the default macOS volume, so an
+    existing IMG_0001.PNG still counts as IMG_0001.png. Each destination is
+    yielded at most once, even with overwrite.
+    """
+    existing: set[str] = set()
+    if not overwrite:
+        with os.scandir(out_dir) as it:
+            existing = {
+                lowered for lowered in (entry.name.lower() for entry in it)
+                if lowered.endswith(".png")
+            }
+
+    log_skips = logger.isEnabledFor(logging.DEBUG)
+    join, out_s = os.path.join, str(out_dir)
+    with os.scandir(in_dir) as it:
+        for entry in it:
+            src_name = entry.name
+            if not src_name.endswith(HEIC_SUFFIXES) or not entry.is_file(follow_symlinks=False):
+                continue
+            name = src_name[:-5] + ".png"
+            key = name.lower()
+            if key in existing:
+                if log_skips:
+                    logger.debug(f"Skipping {src_name} (output already exists)")
+                continue
+            # a.heic and a.HEIC share a destination; converting both at once
+            # would have two workers writing the same file
+            existing.add(key)
+            yield Path(entry.path), Path(join(out_s, name))
 
 
 def convert_heic_to_png(
     input_dir: Path | str | None = None,
     output_dir: Path | str | None = None,
-    overwrite: bool = False
+    overwrite: bool = False,
+    png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+    encoder: str = "auto",
+    jobs: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
 ) -> int:
     """
     Convert all .HEIC images from input_dir to .png.
@@ -110,13 +505,30 @@ def convert_heic_to_png(
     - input_dir: directory that contains .HEIC files. Defaults to '<project_root>/data'.
     - output_dir: where to place .png files. Defaults to input_dir.
     - overwrite: if False, existing .png files are skipped.
+    - png_compress_level: zlib level (0-9) for the Pillow encoder. Ignored by sips.
+    - encoder: PNG encoder for the Pillow path, one of ENCODERS. "auto" picks
+      "spng" when pyspng-seunglab is installed, otherwise "pillow".
+    - jobs: number of parallel workers. Defaults to the CPU count for Pillow and
+      twice that (at most 32) for sips. With 1, Pillow decodes and encodes on
+      two overlapping threads instead of using a process pool.
+    - chunksize: files sent to a Pillow worker process at a time. Larger values
+      cut IPC overhead on big batches; smaller ones balance load better.
 
     Returns the number of files successfully converted.
 
     Raises:
         FileNotFoundError: If input_dir does not exist.
         NotADirectoryError: If input_dir is not a directory.
+        ValueError: If encoder is not one of ENCODERS, or jobs or chunksize is
+            less than 1.
     """
+    if encoder not in ENCODERS:
+        raise ValueError(f"Unknown encoder {encoder!r}, expected one of {ENCODERS}")
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
     project_root = Path(__file__).resolve().parent
     in_dir = Path(input_dir) if input_dir else project_root / "data"
     out_dir = Path(output_dir) if output_dir else in_dir
@@ -128,31 +540,28 @@ def convert_heic_to_png(
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    use_sips = _has_sips()
-    logger.info(f"Using {'sips' if use_sips else 'Pillow'} for conversion")
-
-    converted = 0
-    errors = []
-
-    for src in iter_heic_files(in_dir):
-        dst = out_dir / (src.stem + ".png")
-        if dst.exists() and not overwrite:
-            logger.debug(f"Skipping {src.name} (output already exists)")
-            continue
-        
-        logger.info(f"Converting {src.name}...")
-        
-        if use_sips:
-            ok, msg = _convert_with_sips(src, dst)
-        else:
-            ok, msg = _convert_with_pillow(src, dst)
-        
-        if ok:
-            converted += 1
-            logger.info(f"Successfully converted {src.name}")
-        else:
-            errors.append((src.name, msg))
-            logger.error(f"Failed to convert {src.name}: {msg}")
+    use_sips = _HAS_SIPS
+    if use_sips:
+        logger.info("Using sips for conversion")
+    else:
+        if encoder != "pillow":
+            has_spng = _has_spng()
+            if encoder == "spng" and not has_spng:
+                logger.warning("pyspng-seunglab is not installed; falling back to Pillow's encoder")
+            encoder = "spng" if has_spng else "pillow"
+        logger.info(f"Using Pillow for conversion (PNG encoder: {encoder})")
+
+    pending = list(pending_conversions(in_dir, out_dir, overwrite))
+    logger.info(f"Converting {len(pending)} file(s)...")
+
+    outcomes = [
+        _log_outcome(src, ok, msg)
+        for src, ok, msg in _iter_results(
+            pending, use_sips, png_compress_level, encoder, jobs, chunksize
+        )
+    ]
+    errors = [(name, msg) for name, ok, msg in outcomes if not ok]
+    converted = len(outcomes) - len(errors)
 
     if errors:
         logger.warning(f"Completed with {len(errors)} error(s)")
@@ -189,6 +598,33 @@ Examples:
         action="store_true",
         help="Overwrite existing PNG files"
     )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_PNG_COMPRESS_LEVEL,
+        metavar="0-9",
+        help=f"PNG zlib compression level for Pillow (default: {DEFAULT_PNG_COMPRESS_LEVEL})"
+    )
+    parser.add_argument(
+        "--encoder",
+        choices=ENCODERS,
+        default="auto",
+        help="PNG encoder for the Pillow path; 'spng' needs pyspng-seunglab (default: auto)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of parallel workers (default: CPU count; 2x, up to 32, for sips)"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=DEFAULT_CHUNKSIZE,
+        metavar="N",
+        help=f"Files sent to each Pillow worker at a time (default: {DEFAULT_CHUNKSIZE})"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -196,12 +632,24 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     try:
-        count = convert_heic_to_png(args.input, args.output, args.overwrite)
+        count = convert_heic_to_png(
+            args.input,
+            args.output,
+            args.overwrite,
+            args.compress_level,
+            args.encoder,
+            args.jobs,
+            args.chunksize,
+        )
         print(f"Converted {count} file(s) to PNG.")
     except (FileNotFoundError, NotADirectoryError) as e:
         logger.error(str(e))
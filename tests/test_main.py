@@ -0,0 +1,259 @@
+import os
+import stat
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import main
+
+Image = pytest.importorskip("PIL.Image")
+pillow_heif = pytest.importorskip("pillow_heif")
+pillow_heif.register_heif_opener()
+
+# Stands in for macOS sips: "-s format png <inputs...> --out <file-or-dir>".
+# With STUB_SIPS_KEEP_NAME set it mimics older releases that keep the
+# source file name when writing into a directory.
+STUB_SIPS = """\
+#!{python}
+import os
+import sys
+from PIL import Image
+import pillow_heif
+
+pillow_heif.register_heif_opener()
+args = sys.argv[1:]
+out = args[args.index("--out") + 1]
+status = 0
+for src in args[3:args.index("--out")]:
+    if os.path.isdir(out):
+        name = os.path.basename(src)
+        if not os.environ.get("STUB_SIPS_KEEP_NAME"):
+            name = os.path.splitext(name)[0] + ".png"
+        target = os.path.join(out, name)
+    else:
+        target = out
+    try:
+        Image.open(src).save(target, "PNG")
+    except Exception as e:
+        print(f"Error: {{src}}: {{e}}", file=sys.stderr)
+        status = 1
+sys.exit(status)
+"""
+
+
+def _make_heic(path: Path, size=(64, 48), color=(10, 120, 200)) -> Path:
+    Image.new("RGB", size, color).save(path)
+    return path
+
+
+@pytest.fixture
+def stub_sips(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "sips"
+    script.write_text(STUB_SIPS.format(python=sys.executable))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(main, "_SIPS_PATH", str(script))
+    return script
+
+
+@pytest.mark.parametrize("keep_name", [False, True])
+def test_run_sips_batch_moves_outputs_into_place(tmp_path, stub_sips, monkeypatch, keep_name):
+    if keep_name:
+        monkeypatch.setenv("STUB_SIPS_KEEP_NAME", "1")
+    src_dir = tmp_path / "in"
+    src_dir.mkdir()
+    pairs = [
+        (_make_heic(src_dir / f"img{i}.heic"), src_dir / f"img{i}.png") for i in range(3)
+    ]
+
+    assert main._run_sips_batch(pairs) == [(True, "")] * 3
+
+    # Sources untouched, outputs are PNGs, scratch directory cleaned up
+    assert sorted(p.name for p in src_dir.iterdir()) == [
+        "img0.heic", "img0.png", "img1.heic", "img1.png", "img2.heic", "img2.png"
+    ]
+    for _, dst in pairs:
+        with Image.open(dst) as im:
+            assert im.format == "PNG"
+
+
+def test_convert_batch_with_sips_mixes_passthrough_and_failures(tmp_path, stub_sips):
+    wrapped = tmp_path / "wrapped.heic"
+    Image.new("RGB", (8, 8)).save(wrapped, format="PNG")
+    bad = tmp_path / "bad.heic"
+    bad.write_bytes(b"not an image")
+    worse = tmp_path / "worse.heic"
+    worse.write_bytes(b"also not an image")
+    good = _make_heic(tmp_path / "good.heic")
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    results = main._convert_batch_with_sips([
+        (good, out_dir / "good.png"),
+        (wrapped, out_dir / "wrapped.png"),
+        (bad, out_dir / "bad.png"),
+        (worse, out_dir / "worse.png"),
+    ])
+
+    assert results[0] == (True, "")
+    assert results[1] == (True, "")
+    # Each failure carries only the sips lines about its own file
+    assert results[2][0] is False and "bad.heic" in results[2][1]
+    assert "worse.heic" not in results[2][1]
+    assert results[3][0] is False and "worse.heic" in results[3][1]
+    assert "bad.heic" not in results[3][1]
+    assert (out_dir / "wrapped.png").read_bytes() == wrapped.read_bytes()
+    assert not (out_dir / "bad.png").exists()
+
+
+def test_sips_batch_reports_bad_destinations_per_file(tmp_path, stub_sips, monkeypatch):
+    monkeypatch.setattr(main, "_HAS_SIPS", True)
+    in_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    in_dir.mkdir()
+    out_dir.mkdir()
+    for i in range(3):
+        _make_heic(in_dir / f"img{i}.heic")
+    (out_dir / "img1.png").mkdir()
+
+    assert main.convert_heic_to_png(in_dir, out_dir, overwrite=True, jobs=1) == 2
+    assert (out_dir / "img0.png").is_file() and (out_dir / "img2.png").is_file()
+
+
+def test_sips_batch_fails_every_file_without_scratch_dir(tmp_path, stub_sips, monkeypatch):
+    def no_scratch(*args, **kwargs):
+        raise PermissionError("read-only output directory")
+
+    monkeypatch.setattr(main.tempfile, "TemporaryDirectory", no_scratch)
+    pairs = [(_make_heic(tmp_path / f"img{i}.heic"), tmp_path / f"img{i}.png") for i in range(2)]
+
+    assert main._run_sips_batch(pairs) == [(False, "read-only output directory")] * 2
+
+
+def test_pending_conversions_skips_existing_and_duplicate_destinations(tmp_path):
+    in_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    in_dir.mkdir()
+    out_dir.mkdir()
+    for name in ("a.heic", "a.HEIC", "b.heic", "c.HEIC", "notes.txt"):
+        (in_dir / name).write_bytes(b"")
+    (in_dir / "dir.heic").mkdir()
+    (out_dir / "B.PNG").write_bytes(b"")
+
+    pending = list(main.pending_conversions(in_dir, out_dir))
+    assert sorted(dst.name for _, dst in pending) == ["a.png", "c.png"]
+    assert all(dst.parent == out_dir for _, dst in pending)
+
+    pending = list(main.pending_conversions(in_dir, out_dir, overwrite=True))
+    assert sorted(dst.name for _, dst in pending) == ["a.png", "b.png", "c.png"]
+
+
+def test_heif_to_image_honours_stride_and_reuses_pool(monkeypatch):
+    monkeypatch.setattr(main, "_IMAGE_POOL", {})
+    width, height, stride = 3, 2, 16  # rows padded past width * 3 bytes
+    rows = [bytes(range(r * 9, r * 9 + 9)) + b"\xff" * (stride - 9) for r in range(height)]
+    frame = SimpleNamespace(mode="RGB", size=(width, height), data=b"".join(rows), stride=stride)
+
+    first = main._heif_to_image(frame)
+    assert first.tobytes() == b"".join(row[:9] for row in rows)
+    assert main._heif_to_image(frame) is first
+
+    other = SimpleNamespace(mode="RGB", size=(1, 1), data=b"\x01\x02\x03", stride=3)
+    assert main._heif_to_image(other) is not first
+    assert list(main._IMAGE_POOL) == [("RGB", (1, 1))]
+
+
+def test_heif_to_image_shares_buffer_for_rgba():
+    data = bytearray(b"\x01\x02\x03\x04" * 4)
+    frame = SimpleNamespace(mode="RGBA", size=(2, 2), data=data, stride=8)
+
+    image = main._heif_to_image(frame)
+    data[0] = 99
+    assert image.getpixel((0, 0)) == (99, 2, 3, 4)
+
+
+def test_convert_with_pillow_keeps_icc_profile(tmp_path):
+    ImageCms = pytest.importorskip("PIL.ImageCms")
+    icc = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+    src = tmp_path / "profiled.heic"
+    Image.new("RGB", (16, 16), (200, 30, 30)).save(src, icc_profile=icc)
+    dst = tmp_path / "profiled.png"
+
+    for encoder in ("pillow", "spng"):
+        assert main._convert_with_pillow(src, dst, 1, encoder) == (True, "")
+        with Image.open(dst) as im:
+            assert im.info.get("icc_profile") == icc
+
+
+@pytest.mark.parametrize("mode,channels", [("RGB", 3), ("RGBA", 4)])
+def test_spng_encoder_honours_padded_stride(tmp_path, monkeypatch, mode, channels):
+    pyspng = pytest.importorskip("pyspng")
+    if not hasattr(pyspng, "encode"):
+        pytest.skip("pyspng build without encode()")
+    pytest.importorskip("numpy")
+
+    def pillow_encoder(*args, **kwargs):
+        raise AssertionError("expected the spng encoder")
+
+    monkeypatch.setattr(main, "_heif_to_image", pillow_encoder)
+    width, height = 3, 2
+    row_bytes = width * channels
+    stride = row_bytes + 5
+    rows = [
+        bytes((r * 50 + i) % 256 for i in range(row_bytes)) + b"\xee" * (stride - row_bytes)
+        for r in range(height)
+    ]
+    frame = SimpleNamespace(mode=mode, size=(width, height), data=b"".join(rows), stride=stride)
+    dst = tmp_path / "out.png"
+
+    main._encode_png(frame, dst, 1, "spng")
+
+    with Image.open(dst) as im:
+        assert im.mode == mode
+        assert im.tobytes() == b"".join(row[:row_bytes] for row in rows)
+
+
+def test_pipelined_conversion_reports_in_input_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "_HAS_SIPS", False)
+    in_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    in_dir.mkdir()
+    for i in range(4):
+        _make_heic(in_dir / f"img{i}.heic", color=(i * 60, 10, 10))
+    Image.new("RGB", (8, 8)).save(in_dir / "wrapped.heic", format="PNG")
+    (in_dir / "bad.heic").write_bytes(b"corrupt")
+
+    scanned, reported, prefetched = [], [], []
+    scan, log_outcome, readahead = (
+        main.pending_conversions, main._log_outcome, main._readahead
+    )
+
+    def record_scan(*args):
+        for src, dst in scan(*args):
+            scanned.append(src.name)
+            yield src, dst
+
+    def record_outcome(src, ok, msg):
+        reported.append((src.name, ok))
+        return log_outcome(src, ok, msg)
+
+    def record_readahead(path):
+        prefetched.append(path.name)
+        readahead(path)
+
+    monkeypatch.setattr(main, "pending_conversions", record_scan)
+    monkeypatch.setattr(main, "_log_outcome", record_outcome)
+    monkeypatch.setattr(main, "_readahead", record_readahead)
+
+    assert main.convert_heic_to_png(in_dir, out_dir, jobs=1) == 5
+
+    assert [name for name, _ in reported] == scanned
+    assert dict(reported)["bad.heic"] is False
+    assert sorted(prefetched) == sorted(scanned)
+    assert (out_dir / "wrapped.png").read_bytes() == (in_dir / "wrapped.heic").read_bytes()
+    with Image.open(out_dir / "img3.png") as im:
+        assert im.size == (64, 48)